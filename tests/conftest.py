@@ -1,7 +1,8 @@
 # stdlib
-from typing import Callable, Type, TypeVar, Union
+from typing import Callable, Iterator, Type, TypeVar, Union
 
 # 3rd party
+import dom_toml
 import pytest
 from packaging.markers import Marker
 from packaging.requirements import Requirement
@@ -23,6 +24,12 @@ from pyproject_parser.classes import License, Readme
 from pytest_regressions.data_regression import RegressionYamlDumper
 
 # this package
+from tests.example_configs import (
+		MINIMAL_DESCRIPTION,
+		MINIMAL_REQUIRES_PYTHON,
+		MINIMAL_REQUIRES_PYTHON_COMPLEX
+		)
+from tests.utils import cached_toml_load
 from whey.additional_files import AdditionalFilesEntry
 
 _C = TypeVar("_C", bound=Callable)
@@ -65,19 +72,40 @@ def represent_additional_files_entry(  # noqa: MAN002
 	return dumper.represent_dict(data.to_dict())
 
 
+def pytest_configure(config) -> None:
+	# Registered here rather than in tox.ini, as repo_helper manages the [pytest] section there.
+	config.addinivalue_line("markers", "slow: builds large configurations; deselect with -m 'not slow'")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_toml_parsing() -> Iterator[None]:
+	# Patched by hand, as the monkeypatch fixture is function-scoped.
+	original_load = dom_toml.load
+	dom_toml.load = cached_toml_load
+
+	try:
+		yield
+	finally:
+		dom_toml.load = original_load
+
+
+@pytest.fixture(autouse=True)
+def no_compress(monkeypatch) -> None:
+	# Deflating the members dominates build time.
+	# Tests covering the default opt out, as in test_pep517_backend.py and test_build.py.
+	monkeypatch.setenv("WHEY_NO_COMPRESS", '1')
+
+
 @pytest.fixture(
 		params=[
 				pytest.param(MINIMAL_CONFIG, id="minimal"),
-				pytest.param(f'{MINIMAL_CONFIG}\ndescription = "Lovely Spam! Wonderful Spam!"', id="description"),
-				pytest.param(f'{MINIMAL_CONFIG}\nrequires-python = ">=3.8"', id="requires-python"),
-				pytest.param(
-						f'{MINIMAL_CONFIG}\nrequires-python = ">=2.7,!=3.0.*,!=3.2.*"',
-						id="requires-python_complex"
-						),
+				pytest.param(MINIMAL_DESCRIPTION, id="description"),
+				pytest.param(MINIMAL_REQUIRES_PYTHON, id="requires-python"),
+				pytest.param(MINIMAL_REQUIRES_PYTHON_COMPLEX, id="requires-python_complex"),
 				pytest.param(KEYWORDS, id="keywords"),
 				pytest.param(AUTHORS, id="authors"),
 				pytest.param(MAINTAINERS, id="maintainers"),
-				pytest.param(CLASSIFIERS, id="classifiers"),
+				pytest.param(CLASSIFIERS, id="classifiers", marks=pytest.mark.slow),
 				pytest.param(DEPENDENCIES, id="dependencies"),
 				pytest.param(OPTIONAL_DEPENDENCIES, id="optional-dependencies"),
 				pytest.param(URLS, id="urls"),
@@ -1,3 +1,6 @@
+# 3rd party
+from pyproject_examples.example_configs import MINIMAL_CONFIG
+
 COMPLETE_A = """\
 [build-system]
 requires = [ "whey",]
@@ -79,3 +82,7 @@ platforms = [ "Windows", "macOS", "Linux",]
 license-key = "MIT"
 package = "whey"
 """
+
+MINIMAL_DESCRIPTION = f'{MINIMAL_CONFIG}\ndescription = "Lovely Spam! Wonderful Spam!"'
+MINIMAL_REQUIRES_PYTHON = f'{MINIMAL_CONFIG}\nrequires-python = ">=3.8"'
+MINIMAL_REQUIRES_PYTHON_COMPLEX = f'{MINIMAL_CONFIG}\nrequires-python = ">=2.7,!=3.0.*,!=3.2.*"'
@@ -1,37 +1,107 @@
 # stdlib
 import os
-import shutil
 import sys
-import tempfile
+import zipfile
 from base64 import urlsafe_b64encode
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List
+from hashlib import sha256
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
 
 # 3rd party
 import handy_archives
 import pytest
 from coincidence.regressions import AdvancedDataRegressionFixture, AdvancedFileRegressionFixture
 from coincidence.selectors import min_version, only_version
-from domdf_python_tools.paths import PathPlus, compare_dirs
+from domdf_python_tools.paths import PathPlus
 from pyproject_examples.example_configs import DYNAMIC_REQUIREMENTS, LONG_REQUIREMENTS, MINIMAL_CONFIG
-from shippinglabel.checksum import get_sha256_hash
 
 # this package
 import whey
 from tests.example_configs import COMPLETE_A, COMPLETE_B
-from whey.builder import SDistBuilder, WheelBuilder
+from tests.utils import link_files, write_files, write_pyproject
+from whey.builder import AbstractBuilder, SDistBuilder, WheelBuilder
 from whey.config import load_toml
 
 if TYPE_CHECKING:
 	# 3rd party
 	from _pytest.capture import CaptureFixture
 
+_B = TypeVar("_B", bound=AbstractBuilder)
+
+COMPLETE_A_SOURCE_DIR = f"{COMPLETE_A}\nsource-dir = 'src'"
+COMPLETE_B_SOURCE_DIR = f"{COMPLETE_B}\nsource-dir = 'src'"
+COMPLETE_B_MARKDOWN = COMPLETE_B.replace(".rst", ".md")
+
+
+def make_builder(
+		builder_type: Type[_B],
+		project_dir: PathPlus,
+		config: Dict[str, Any],
+		build_dir: PathPlus,
+		out_dir: Optional[PathPlus] = None,
+		*,
+		verbose: bool = False,
+		) -> _B:
+	"""
+	Construct a ``builder_type`` with colour disabled.
+
+	The output directory defaults to ``project_dir``.
+	"""
+
+	return builder_type(
+			project_dir=project_dir,
+			config=config,
+			build_dir=build_dir,
+			out_dir=out_dir or project_dir,
+			verbose=verbose,
+			colour=False,
+			)
+
 
 @pytest.fixture()
 def fixed_whey_version(monkeypatch) -> None:
 	monkeypatch.setattr(whey, "__version__", "0.0.17")
 
 
+@pytest.fixture()
+def compress(monkeypatch) -> None:
+	# Opts out of the autouse no_compress fixture, so the wheel is built with the default compression.
+	monkeypatch.delenv("WHEY_NO_COMPRESS", raising=False)
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory) -> PathPlus:
+	"""
+	A directory containing ``whey/__init__.py``, ``README.rst``, ``LICENSE`` and ``requirements.txt``.
+	"""
+
+	template_dir = PathPlus(tmp_path_factory.mktemp("project_template"))
+	write_files(template_dir, {
+			"whey/__init__.py": "print('hello world')\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
+
+	return template_dir
+
+
+@pytest.fixture()
+def project_skeleton(project_template: PathPlus, tmp_pathplus: PathPlus) -> None:
+	"""
+	Populate ``tmp_pathplus`` with the files from ``project_template``.
+	"""
+
+	link_files(project_template, tmp_pathplus)
+
+
+def get_output(capsys: "CaptureFixture[str]", tmp_pathplus: PathPlus) -> Dict[str, str]:
+	# Replace the (random) temporary directory so the output is stable between runs.
+	outerr = capsys.readouterr()
+	return {"stdout": outerr.out.replace(tmp_pathplus.as_posix(), "..."), "stderr": outerr.err}
+
+
 def test_build_success(
 		good_config: str,
 		tmp_pathplus: PathPlus,
@@ -39,100 +109,84 @@ def test_build_success(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(good_config)
-	(tmp_pathplus / "spam").mkdir()
-	(tmp_pathplus / "spam" / "__init__.py").write_clean("print('hello world')")
+	write_pyproject(tmp_pathplus, good_config)
+	write_files(tmp_pathplus, {"spam/__init__.py": "print('hello world')\n"})
 	now = datetime.now()
 	os.utime(tmp_pathplus / "spam" / "__init__.py", (now.timestamp(), now.timestamp()))
 
-	data: Dict[str, Any] = {}
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / wheel).is_file()
+	data: Dict[str, Any] = {}
 
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-			data["wheel_content"] = zip_file.namelist()
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-			assert zip_file.read_text("spam/__init__.py") == "print('hello world')\n"
-			advanced_file_regression.check(zip_file.read_text("spam-2020.0.0.dist-info/METADATA"))
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = zip_file.namelist()
 
-			# The seconds can vary by 1 second between the mtime and the time in the zip, but this is inconsistent
-			assert zip_file.getinfo("spam/__init__.py").date_time[:5] == now.timetuple()[:5]
+		assert zip_file.read_text("spam/__init__.py") == "print('hello world')\n"
+		advanced_file_regression.check(zip_file.read_text("spam-2020.0.0.dist-info/METADATA"))
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
+		# The seconds can vary by 1 second between the mtime and the time in the zip, but this is inconsistent
+		assert zip_file.getinfo("spam/__init__.py").date_time[:5] == now.timetuple()[:5]
 
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
 
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
-			assert tar.read_text("spam-2020.0.0/spam/__init__.py") == "print('hello world')\n"
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
+		assert tar.read_text("spam-2020.0.0/spam/__init__.py") == "print('hello world')\n"
 
-			advanced_file_regression.check(tar.read_text("spam-2020.0.0/PKG-INFO"))
-			advanced_file_regression.check(tar.read_text("spam-2020.0.0/pyproject.toml"), extension=".toml")
+		advanced_file_regression.check(tar.read_text("spam-2020.0.0/PKG-INFO"))
+		advanced_file_regression.check(tar.read_text("spam-2020.0.0/pyproject.toml"), extension=".toml")
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
 
-def check_built_wheel(filename: PathPlus, advanced_file_regression: AdvancedFileRegressionFixture) -> List[str]:
-	assert filename.is_file()
-
-	with handy_archives.ZipFile(filename) as zip_file:
+def check_record(zip_file: handy_archives.ZipFile, record: str) -> None:
+	contents = zip_file.namelist()
 
-		assert zip_file.read_text("whey/__init__.py") == "print('hello world')\n"
-		advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
-		advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/RECORD"), extension=".RECORD")
+	for line in record.splitlines():
+		entry_filename, expected_digest, size, *_ = line.strip().split(',')
+		assert entry_filename in contents, entry_filename
+		contents.remove(entry_filename)
 
-		contents = zip_file.namelist()
+		if "RECORD" not in entry_filename:
+			assert zip_file.getinfo(entry_filename).file_size == int(size)
 
-		with zip_file.open("whey-2021.0.0.dist-info/RECORD", mode='r') as record_fp:
-			for line in record_fp.readlines():
-				entry_filename, expected_digest, size, *_ = line.decode("UTF-8").strip().split(',')
-				assert entry_filename in contents, entry_filename
-				contents.remove(entry_filename)
+			sha256_hash = sha256(zip_file.read(entry_filename))
+			digest = "sha256=" + urlsafe_b64encode(sha256_hash.digest()).decode("latin1").rstrip('=')
+			assert expected_digest == digest
 
-				if "RECORD" not in entry_filename:
-					assert zip_file.getinfo(entry_filename).file_size == int(size)
 
-					with zip_file.open(entry_filename) as fp:
-						sha256_hash = get_sha256_hash(fp)
+def check_built_wheel(
+		zip_file: handy_archives.ZipFile,
+		advanced_file_regression: AdvancedFileRegressionFixture,
+		) -> List[str]:
+	assert zip_file.read_text("whey/__init__.py") == "print('hello world')\n"
+	advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
 
-					digest = "sha256=" + urlsafe_b64encode(sha256_hash.digest()).decode("latin1").rstrip('=')
-					assert expected_digest == digest
+	record = zip_file.read_text("whey-2021.0.0.dist-info/RECORD")
+	advanced_file_regression.check(record, extension=".RECORD")
+	check_record(zip_file, record)
 
-		return zip_file.namelist()
+	return zip_file.namelist()
 
 
-@pytest.mark.usefixtures("fixed_whey_version")
+@pytest.mark.usefixtures("compress", "fixed_whey_version", "project_skeleton")
 @pytest.mark.parametrize(
 		"config",
 		[
 				# pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
 				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS"),
+				pytest.param(COMPLETE_B, id="COMPLETE_B", marks=pytest.mark.slow),
+				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS", marks=pytest.mark.slow),
 				]
 		)
 def test_build_complete(
@@ -142,67 +196,50 @@ def test_build_complete(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_pyproject(tmp_pathplus, config)
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		wheel = wheel_builder.build_wheel()
-		data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel, advanced_file_regression)
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
-
-			assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world')\n"
-			assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
-			assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
-			assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
-
-			advanced_file_regression.check(tar.read_text("whey-2021.0.0/PKG-INFO"))
-			advanced_file_regression.check(tar.read_text("whey-2021.0.0/pyproject.toml"), extension=".toml")
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = check_built_wheel(zip_file, advanced_file_regression)
+		assert {info.compress_type for info in zip_file.infolist()} == {zipfile.ZIP_DEFLATED}
+
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
+
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
+
+		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world')\n"
+		assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
+		assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
+		assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+
+		advanced_file_regression.check(tar.read_text("whey-2021.0.0/PKG-INFO"))
+		advanced_file_regression.check(tar.read_text("whey-2021.0.0/pyproject.toml"), extension=".toml")
+
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
 
-@pytest.mark.usefixtures("fixed_whey_version")
+@pytest.mark.usefixtures("fixed_whey_version", "project_skeleton")
 @pytest.mark.parametrize(
 		"config",
 		[
 				# pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
 				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS"),
+				pytest.param(COMPLETE_B, id="COMPLETE_B", marks=pytest.mark.slow),
+				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS", marks=pytest.mark.slow),
 				]
 		)
 def test_build_complete_epoch(
@@ -213,48 +250,38 @@ def test_build_complete_epoch(
 		capsys: "CaptureFixture[str]",
 		monkeypatch,
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_pyproject(tmp_pathplus, config)
 
 	monkeypatch.setenv("SOURCE_DATE_EPOCH", "1629644172")
 
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
+
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-		wheel = wheel_builder.build_wheel()
-		data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel, advanced_file_regression)
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = check_built_wheel(zip_file, advanced_file_regression)
 
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-			for filename in data["wheel_content"]:
-				assert zip_file.getinfo(filename).date_time == (2021, 8, 22, 14, 56, 12)
+		for filename in data["wheel_content"]:
+			assert zip_file.getinfo(filename).date_time == (2021, 8, 22, 14, 56, 12)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
 
+@pytest.mark.usefixtures("project_skeleton")
 @pytest.mark.parametrize(
 		"config",
 		[
 				# pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
 				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS"),
+				pytest.param(COMPLETE_B, id="COMPLETE_B", marks=pytest.mark.slow),
+				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS", marks=pytest.mark.slow),
 				]
 		)
 @pytest.mark.parametrize(
@@ -271,28 +298,17 @@ def test_build_editable(
 		capsys: "CaptureFixture[str]",
 		editables_version: str
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_pyproject(tmp_pathplus, config)
 
-	data: Dict[str, Any] = {}
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
+	data: Dict[str, Any] = {}
 
-		wheel = wheel_builder.build_editable()
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-	assert (tmp_pathplus / wheel).is_file()
+	wheel = wheel_builder.build_editable()
 
 	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
 		data["wheel_content"] = zip_file.namelist()
@@ -305,26 +321,9 @@ def test_build_editable(
 
 		advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
 
-		contents = zip_file.namelist()
-
-		with zip_file.open("whey-2021.0.0.dist-info/RECORD", mode='r') as record_fp:
-			for line in record_fp.readlines():
-				entry_filename, expected_digest, size, *_ = line.decode("UTF-8").strip().split(',')
-				assert entry_filename in contents, entry_filename
-				contents.remove(entry_filename)
-
-				if "RECORD" not in entry_filename:
-					assert zip_file.getinfo(entry_filename).file_size == int(size)
-
-					with zip_file.open(entry_filename) as fp:
-						sha256_hash = get_sha256_hash(fp)
-
-					digest = "sha256=" + urlsafe_b64encode(sha256_hash.digest()).decode("latin1").rstrip('=')
-					assert expected_digest == digest
+		check_record(zip_file, zip_file.read_text("whey-2021.0.0.dist-info/RECORD"))
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
@@ -377,59 +376,38 @@ def test_build_editable_namespace(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(NAMESPACE)
-	(tmp_pathplus / "sphinxcontrib/default_values").mkdir(parents=True)
-	(tmp_pathplus / "sphinxcontrib/default_values" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
+	write_pyproject(tmp_pathplus, NAMESPACE)
+	write_files(tmp_pathplus, {
+			"sphinxcontrib/default_values/__init__.py": "print('hello world')\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			})
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-		wheel = wheel_builder.build_editable()
+	wheel = wheel_builder.build_editable()
 
 	assert wheel == "default_values-0.5.0-py3-none-any.whl"
-	assert (tmp_pathplus / wheel).is_file()
-
 	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
 		data["wheel_content"] = zip_file.namelist()
 		assert zip_file.read_text("default_values.pth") == str(tmp_pathplus) + '\n'
 
 		advanced_file_regression.check(zip_file.read_text("default_values-0.5.0.dist-info/METADATA"))
 
-		contents = zip_file.namelist()
-
-		with zip_file.open("default_values-0.5.0.dist-info/RECORD", mode='r') as record_fp:
-			for line in record_fp.readlines():
-				entry_filename, expected_digest, size, *_ = line.decode("UTF-8").strip().split(',')
-				assert entry_filename in contents, entry_filename
-				contents.remove(entry_filename)
-
-				if "RECORD" not in entry_filename:
-					assert zip_file.getinfo(entry_filename).file_size == int(size)
+		check_record(zip_file, zip_file.read_text("default_values-0.5.0.dist-info/RECORD"))
 
-					with zip_file.open(entry_filename) as fp:
-						sha256_hash = get_sha256_hash(fp)
-
-					digest = "sha256=" + urlsafe_b64encode(sha256_hash.digest()).decode("latin1").rstrip('=')
-					assert expected_digest == digest
-
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
 
+@pytest.mark.usefixtures("project_skeleton")
 def test_build_additional_files(
 		tmp_pathplus: PathPlus,
 		advanced_data_regression: AdvancedDataRegressionFixture,
@@ -448,63 +426,43 @@ def test_build_additional_files(
 			'  "recursive-exclude whey/static *.txt",',
 			']',
 			])
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "whey" / "style.css").write_clean("This is the style.css file")
-	(tmp_pathplus / "whey" / "static").mkdir()
-	(tmp_pathplus / "whey" / "static" / "foo.py").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.c").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.txt").touch()
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"whey/style.css": "This is the style.css file\n",
+			"whey/static/foo.py": "",
+			"whey/static/foo.c": "",
+			"whey/static/foo.txt": "",
+			})
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / wheel).is_file()
-
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-			data["wheel_content"] = zip_file.namelist()
-
-			assert zip_file.read_text("whey/__init__.py") == "print('hello world')\n"
-			assert zip_file.read_text("whey/style.css") == "This is the style.css file\n"
-			advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
-
-			assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world')\n"
-			assert tar.read_text("whey-2021.0.0/whey/style.css") == "This is the style.css file\n"
-			assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
-			assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
-			assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = zip_file.namelist()
+
+		assert zip_file.read_text("whey/__init__.py") == "print('hello world')\n"
+		assert zip_file.read_text("whey/style.css") == "This is the style.css file\n"
+		advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
+
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
+
+		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world')\n"
+		assert tar.read_text("whey-2021.0.0/whey/style.css") == "This is the style.css file\n"
+		assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
+		assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
+		assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
@@ -517,141 +475,102 @@ def test_build_markdown_readme(
 		capsys: "CaptureFixture[str]",
 		):
 
-	(tmp_pathplus / "pyproject.toml").write_clean(COMPLETE_B.replace(".rst", ".md"))
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.md").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_pyproject(tmp_pathplus, COMPLETE_B_MARKDOWN)
+	write_files(tmp_pathplus, {
+			"whey/__init__.py": "print('hello world')\n",
+			"README.md": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		wheel = wheel_builder.build_wheel()
-		data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel, advanced_file_regression)
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
-
-			assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world')\n"
-			assert tar.read_text("whey-2021.0.0/README.md") == "Spam Spam Spam Spam\n"
-			assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
-			assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = check_built_wheel(zip_file, advanced_file_regression)
+
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
+
+		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world')\n"
+		assert tar.read_text("whey-2021.0.0/README.md") == "Spam Spam Spam Spam\n"
+		assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
+		assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
 
 def test_build_missing_dir(tmp_pathplus: PathPlus):
-	(tmp_pathplus / "pyproject.toml").write_clean(MINIMAL_CONFIG)
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		with pytest.raises(FileNotFoundError, match="Package directory 'spam' not found."):
-			wheel_builder.build_wheel()
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		with pytest.raises(FileNotFoundError, match="Package directory 'spam' not found."):
-			sdist_builder.build_sdist()
+	write_pyproject(tmp_pathplus, MINIMAL_CONFIG)
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
+
+	wheel_builder = make_builder(WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1")
+
+	with pytest.raises(FileNotFoundError, match="Package directory 'spam' not found."):
+		wheel_builder.build_wheel()
+
+	sdist_builder = make_builder(SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2")
+
+	with pytest.raises(FileNotFoundError, match="Package directory 'spam' not found."):
+		sdist_builder.build_sdist()
 
 
 def test_build_empty_dir(tmp_pathplus: PathPlus):
-	(tmp_pathplus / "pyproject.toml").write_clean(MINIMAL_CONFIG)
+	write_pyproject(tmp_pathplus, MINIMAL_CONFIG)
 	(tmp_pathplus / "spam").mkdir()
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		with pytest.raises(FileNotFoundError, match="No Python source files found in"):
-			wheel_builder.build_wheel()
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		with pytest.raises(FileNotFoundError, match="No Python source files found in"):
-			sdist_builder.build_sdist()
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
+
+	wheel_builder = make_builder(WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1")
+
+	with pytest.raises(FileNotFoundError, match="No Python source files found in"):
+		wheel_builder.build_wheel()
+
+	sdist_builder = make_builder(SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2")
+
+	with pytest.raises(FileNotFoundError, match="No Python source files found in"):
+		sdist_builder.build_sdist()
 
 
 def test_build_editable_missing_dir(tmp_pathplus: PathPlus):
-	(tmp_pathplus / "pyproject.toml").write_clean(MINIMAL_CONFIG)
+	write_pyproject(tmp_pathplus, MINIMAL_CONFIG)
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
-		with pytest.raises(FileNotFoundError, match="Package directory 'spam' not found."):
-			wheel_builder.build_editable()
+	wheel_builder = make_builder(WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1")
 
+	with pytest.raises(FileNotFoundError, match="Package directory 'spam' not found."):
+		wheel_builder.build_editable()
 
-@pytest.mark.usefixtures("fixed_whey_version")
+
+def unpack_sdist(filename: PathPlus, destination: PathPlus) -> None:
+	# The sdist was just built by whey, so skip the extraction filter's per-member checks.
+	# extractall() creates the destination directory as needed.
+	with handy_archives.TarFile.open(filename, mode="r:gz") as sdist_tar:
+		sdist_tar.extractall(path=destination, filter=handy_archives.fully_trusted_filter)
+
+
+@pytest.mark.usefixtures("fixed_whey_version", "project_skeleton")
 @pytest.mark.parametrize(
 		"config",
 		[
 				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
+				pytest.param(COMPLETE_B, id="COMPLETE_B", marks=pytest.mark.slow),
 				pytest.param(DYNAMIC_REQUIREMENTS, id="DYNAMIC_REQUIREMENTS"),
-				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS"),
+				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS", marks=pytest.mark.slow),
 				]
 		)
 def test_build_wheel_from_sdist(
@@ -661,123 +580,101 @@ def test_build_wheel_from_sdist(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_lines([
-			"httpx", "gidgethub[httpx]>4.0.0", "django>2.1; os_name != 'nt'", "django>2.0; os_name == 'nt'"
-			])
+	write_pyproject(tmp_pathplus, config)
+	write_files(tmp_pathplus, {
+			"requirements.txt": "httpx\ngidgethub[httpx]>4.0.0\ndjango>2.1; os_name != 'nt'\ndjango>2.0; os_name == 'nt'\n",
+			})
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	# Build the sdist
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-	# unpack sdist into another tmpdir and use that as project_dir
-	(tmp_pathplus / "sdist_unpacked").mkdir()
-
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as sdist_tar:
-		sdist_tar.extractall(
-				path=tmp_pathplus / "sdist_unpacked",
-				filter=handy_archives.fully_trusted_filter,
-				)
+	sdist_builder = make_builder(SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1")
+
+	sdist = sdist_builder.build_sdist()
+	# unpack sdist into another directory and use that as project_dir
+	unpack_sdist(tmp_pathplus / sdist, tmp_pathplus / "sdist_unpacked")
 
 	capsys.readouterr()
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus / "sdist_unpacked/whey-2021.0.0/",
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-		wheel = wheel_builder.build_wheel()
-		data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel, advanced_file_regression)
+	wheel_builder = make_builder(
+			WheelBuilder,
+			tmp_pathplus / "sdist_unpacked/whey-2021.0.0/",
+			project_config,
+			tmp_pathplus / "build_2",
+			out_dir=tmp_pathplus,
+			verbose=True,
+			)
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = check_built_wheel(zip_file, advanced_file_regression)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
 
+@pytest.mark.usefixtures("compress", "project_skeleton")
 @pytest.mark.parametrize(
 		"config", [
 				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
+				pytest.param(COMPLETE_B, id="COMPLETE_B", marks=pytest.mark.slow),
 				]
 		)
 def test_build_wheel_reproducible(
 		config: str,
 		tmp_pathplus: PathPlus,
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
-
-	# Build the wheel twice
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus / "wheel1",
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
-
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / "wheel1" / wheel).is_file()
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus / "wheel2",
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / "wheel2" / wheel).is_file()
-
-	# extract both
-
-	shutil.unpack_archive(
-			str(tmp_pathplus / "wheel1" / wheel),
-			extract_dir=tmp_pathplus / "wheel1" / "unpack",
-			format="zip",
-			)
-	shutil.unpack_archive(
-			str(tmp_pathplus / "wheel1" / wheel),
-			extract_dir=tmp_pathplus / "wheel2" / "unpack",
-			format="zip",
-			)
-	# (tmp_pathplus / "wheel2" / "unpack" / "foo.txt").touch()
+	write_pyproject(tmp_pathplus, config)
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
+
+	# Build the wheel twice in memory with the same builder; each build starts from a clean build directory.
+
+	wheel_builder = make_builder(WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1")
+
+	wheel1_stream, wheel2_stream = BytesIO(), BytesIO()
+	wheel = wheel_builder._build_wheel_to_stream(wheel1_stream)
+	assert wheel_builder._build_wheel_to_stream(wheel2_stream) == wheel
+	assert not list(tmp_pathplus.glob("*.whl"))
+
+	# Compare the members' names and contents.
+	# The timestamps of the generated dist-info files may legitimately differ between the two builds.
+
+	with handy_archives.ZipFile(wheel1_stream) as zip_file:
+		wheel1_members = sorted((info.filename, info.CRC, info.file_size) for info in zip_file.infolist())
+
+	with handy_archives.ZipFile(wheel2_stream) as zip_file:
+		wheel2_members = sorted((info.filename, info.CRC, info.file_size) for info in zip_file.infolist())
+
+	assert wheel1_members == wheel2_members
+
+
+@pytest.mark.usefixtures("project_skeleton")
+def test_build_wheel_to_stream(tmp_pathplus: PathPlus):
+	write_pyproject(tmp_pathplus, COMPLETE_A)
 
-	assert compare_dirs(
-			tmp_pathplus / "wheel1" / "unpack",
-			tmp_pathplus / "wheel2" / "unpack",
+	wheel_builder = make_builder(
+			WheelBuilder,
+			tmp_pathplus,
+			load_toml(tmp_pathplus / "pyproject.toml"),
+			tmp_pathplus / "build",
+			out_dir=tmp_pathplus / "dist",
 			)
 
+	wheel = wheel_builder.build_wheel()
+
+	stream = BytesIO()
+	assert wheel_builder._build_wheel_to_stream(stream) == wheel
+	assert os.listdir(tmp_pathplus / "dist") == [wheel]
+
+	with handy_archives.ZipFile(tmp_pathplus / "dist" / wheel) as zip_file:
+		on_disk = sorted(zip_file.namelist())
+
+	with handy_archives.ZipFile(stream) as zip_file:
+		assert sorted(zip_file.namelist()) == on_disk
+		assert zip_file.read_text("whey/__init__.py") == "print('hello world')\n"
+
 
 @pytest.mark.parametrize(
 		"config",
@@ -808,53 +705,36 @@ def test_build_underscore_name(
 		config: List[str]
 		):
 	(tmp_pathplus / "pyproject.toml").write_lines(config)
-	(tmp_pathplus / "spam_spam").mkdir()
-	(tmp_pathplus / "spam_spam" / "__init__.py").write_clean("print('hello world')")
+	write_files(tmp_pathplus, {"spam_spam/__init__.py": "print('hello world')\n"})
 
-	data: Dict[str, Any] = {}
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
-
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / wheel).is_file()
+	data: Dict[str, Any] = {}
 
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-			data["wheel_content"] = zip_file.namelist()
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-			assert zip_file.read_text("spam_spam/__init__.py") == "print('hello world')\n"
-			advanced_file_regression.check(zip_file.read_text("spam_spam-2020.0.0.dist-info/METADATA"))
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = zip_file.namelist()
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
+		assert zip_file.read_text("spam_spam/__init__.py") == "print('hello world')\n"
+		advanced_file_regression.check(zip_file.read_text("spam_spam-2020.0.0.dist-info/METADATA"))
 
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
 
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
 
-			assert tar.read_text("spam_spam-2020.0.0/spam_spam/__init__.py") == "print('hello world')\n"
+		assert tar.read_text("spam_spam-2020.0.0/spam_spam/__init__.py") == "print('hello world')\n"
 
-			advanced_file_regression.check(tar.read_text("spam_spam-2020.0.0/PKG-INFO"))
+		advanced_file_regression.check(tar.read_text("spam_spam-2020.0.0/PKG-INFO"))
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
@@ -870,55 +750,38 @@ def test_build_stubs_name(
 			'name = "spam_spam-stubs"',
 			'version = "2020.0.0"',
 			])
-	(tmp_pathplus / "spam_spam-stubs").mkdir()
-	(tmp_pathplus / "spam_spam-stubs" / "__init__.pyi").write_clean("print('hello world')")
-
-	data: Dict[str, Any] = {}
+	write_files(tmp_pathplus, {"spam_spam-stubs/__init__.pyi": "print('hello world')\n"})
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / wheel).is_file()
+	data: Dict[str, Any] = {}
 
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-			data["wheel_content"] = zip_file.namelist()
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-			assert zip_file.read_text("spam_spam-stubs/__init__.pyi") == "print('hello world')\n"
-			advanced_file_regression.check(zip_file.read_text("spam_spam_stubs-2020.0.0.dist-info/METADATA"))
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = zip_file.namelist()
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
+		assert zip_file.read_text("spam_spam-stubs/__init__.pyi") == "print('hello world')\n"
+		advanced_file_regression.check(zip_file.read_text("spam_spam_stubs-2020.0.0.dist-info/METADATA"))
 
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
 
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
 
-			assert tar.read_text(
-					"spam_spam_stubs-2020.0.0/spam_spam-stubs/__init__.pyi"
-					) == "print('hello world')\n"
+		assert tar.read_text(
+				"spam_spam_stubs-2020.0.0/spam_spam-stubs/__init__.pyi"
+				) == "print('hello world')\n"
 
-			advanced_file_regression.check(tar.read_text("spam_spam_stubs-2020.0.0/PKG-INFO"))
+		advanced_file_regression.check(tar.read_text("spam_spam_stubs-2020.0.0/PKG-INFO"))
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
@@ -931,8 +794,8 @@ def test_build_stubs_name(
 		"config",
 		[
 				# pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
-				pytest.param(f"{COMPLETE_A}\nsource-dir = 'src'", id="COMPLETE_A"),
-				pytest.param(f"{COMPLETE_B}\nsource-dir = 'src'", id="COMPLETE_B"),
+				pytest.param(COMPLETE_A_SOURCE_DIR, id="COMPLETE_A"),
+				pytest.param(COMPLETE_B_SOURCE_DIR, id="COMPLETE_B", marks=pytest.mark.slow),
 				# pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS"),
 				]
 		)
@@ -943,55 +806,43 @@ def test_build_source_dir_complete(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "src/whey").mkdir(parents=True)
-	(tmp_pathplus / "src/whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_pyproject(tmp_pathplus, config)
+	write_files(tmp_pathplus, {
+			"src/whey/__init__.py": "print('hello world')\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		wheel = wheel_builder.build_wheel()
-		data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel, advanced_file_regression)
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
-
-			assert tar.read_text("whey-2021.0.0/src/whey/__init__.py") == "print('hello world')\n"
-			assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
-			assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
-			assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
-
-			advanced_file_regression.check(tar.read_text("whey-2021.0.0/PKG-INFO"))
-			advanced_file_regression.check(tar.read_text("whey-2021.0.0/pyproject.toml"), extension=".toml")
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = check_built_wheel(zip_file, advanced_file_regression)
+
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
+
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
+
+		assert tar.read_text("whey-2021.0.0/src/whey/__init__.py") == "print('hello world')\n"
+		assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
+		assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
+		assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+
+		advanced_file_regression.check(tar.read_text("whey-2021.0.0/PKG-INFO"))
+		advanced_file_regression.check(tar.read_text("whey-2021.0.0/pyproject.toml"), extension=".toml")
+
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
@@ -1008,81 +859,50 @@ def test_build_source_dir_different_package(
 			"source-dir = 'src'",
 			"package = 'SpamSpam'",
 			])
-	(tmp_pathplus / "src/SpamSpam").mkdir(parents=True)
-	(tmp_pathplus / "src/SpamSpam" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"src/SpamSpam/__init__.py": "print('hello world')\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / wheel).is_file()
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-
-			assert zip_file.read_text("SpamSpam/__init__.py") == "print('hello world')\n"
-			advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
-			advanced_file_regression.check(
-					zip_file.read_text("whey-2021.0.0.dist-info/RECORD"),
-					extension=".RECORD",
-					)
-
-			contents = zip_file.namelist()
-
-			with zip_file.open("whey-2021.0.0.dist-info/RECORD", mode='r') as record_:
-				for line in record_.readlines():
-					entry_filename, expected_digest, size, *_ = line.decode("UTF-8").strip().split(',')
-					assert entry_filename in contents, entry_filename
-					contents.remove(entry_filename)
-
-					if "RECORD" not in entry_filename:
-						assert zip_file.getinfo(entry_filename).file_size == int(size)
-
-						with zip_file.open(entry_filename) as fp:
-							sha256_hash = get_sha256_hash(fp)
-
-						digest = "sha256=" + urlsafe_b64encode(sha256_hash.digest()).decode("latin1").rstrip('=')
-						assert expected_digest == digest
-
-			data["wheel_content"] = zip_file.namelist()
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
-
-			assert tar.read_text("whey-2021.0.0/src/SpamSpam/__init__.py") == "print('hello world')\n"
-			assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
-			assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
-			assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
-
-			advanced_file_regression.check(tar.read_text("whey-2021.0.0/PKG-INFO"))
-			advanced_file_regression.check(tar.read_text("whey-2021.0.0/pyproject.toml"), extension=".toml")
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+
+		assert zip_file.read_text("SpamSpam/__init__.py") == "print('hello world')\n"
+		advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
+
+		record = zip_file.read_text("whey-2021.0.0.dist-info/RECORD")
+		advanced_file_regression.check(record, extension=".RECORD")
+		check_record(zip_file, record)
+
+		data["wheel_content"] = zip_file.namelist()
+
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
+
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
+
+		assert tar.read_text("whey-2021.0.0/src/SpamSpam/__init__.py") == "print('hello world')\n"
+		assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
+		assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
+		assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+
+		advanced_file_regression.check(tar.read_text("whey-2021.0.0/PKG-INFO"))
+		advanced_file_regression.check(tar.read_text("whey-2021.0.0/pyproject.toml"), extension=".toml")
+
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
@@ -1091,8 +911,8 @@ def test_build_source_dir_different_package(
 @pytest.mark.parametrize(
 		"config",
 		[
-				pytest.param(f"{COMPLETE_A}\nsource-dir = 'src'", id="COMPLETE_A"),
-				pytest.param(f"{COMPLETE_B}\nsource-dir = 'src'", id="COMPLETE_B"),
+				pytest.param(COMPLETE_A_SOURCE_DIR, id="COMPLETE_A"),
+				pytest.param(COMPLETE_B_SOURCE_DIR, id="COMPLETE_B", marks=pytest.mark.slow),
 				# pytest.param(DYNAMIC_REQUIREMENTS, id="DYNAMIC_REQUIREMENTS"),
 				# pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS"),
 				]
@@ -1104,56 +924,41 @@ def test_build_wheel_from_sdist_source_dir(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "src/whey").mkdir(parents=True)
-	(tmp_pathplus / "src/whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
+	write_pyproject(tmp_pathplus, config)
+	write_files(tmp_pathplus, {
+			"src/whey/__init__.py": "print('hello world')\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			})
 	(tmp_pathplus / "requirements.txt").write_lines([
 			"httpx", "gidgethub[httpx]>4.0.0", "django>2.1; os_name != 'nt'", "django>2.0; os_name == 'nt'"
 			])
 
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
+
 	# Build the sdist
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-	# unpack sdist into another tmpdir and use that as project_dir
-	(tmp_pathplus / "sdist_unpacked").mkdir()
-
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as sdist_tar:
-		sdist_tar.extractall(
-				path=tmp_pathplus / "sdist_unpacked",
-				filter=handy_archives.fully_trusted_filter,
-				)
+	sdist_builder = make_builder(SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1")
+
+	sdist = sdist_builder.build_sdist()
+	# unpack sdist into another directory and use that as project_dir
+	unpack_sdist(tmp_pathplus / sdist, tmp_pathplus / "sdist_unpacked")
 
 	capsys.readouterr()
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus / "sdist_unpacked/whey-2021.0.0/",
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-		wheel = wheel_builder.build_wheel()
-		data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel, advanced_file_regression)
+	wheel_builder = make_builder(
+			WheelBuilder,
+			tmp_pathplus / "sdist_unpacked/whey-2021.0.0/",
+			project_config,
+			tmp_pathplus / "build_2",
+			out_dir=tmp_pathplus,
+			verbose=True,
+			)
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = check_built_wheel(zip_file, advanced_file_regression)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
@@ -1176,75 +981,59 @@ def test_build_additional_files_source_dir(
 			'  "recursive-exclude src/whey/static *.txt",',
 			']',
 			])
-	(tmp_pathplus / "src/whey").mkdir(parents=True)
-	(tmp_pathplus / "src/whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "src/whey" / "style.css").write_clean("This is the style.css file")
-	(tmp_pathplus / "src/whey" / "static").mkdir()
-	(tmp_pathplus / "src/whey" / "static" / "foo.py").touch()
-	(tmp_pathplus / "src/whey" / "static" / "foo.c").touch()
-	(tmp_pathplus / "src/whey" / "static" / "foo.txt").touch()
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"src/whey/__init__.py": "print('hello world')\n",
+			"src/whey/style.css": "This is the style.css file\n",
+			"src/whey/static/foo.py": "",
+			"src/whey/static/foo.c": "",
+			"src/whey/static/foo.txt": "",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = WheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
-
-		wheel = wheel_builder.build_wheel()
-		assert (tmp_pathplus / wheel).is_file()
-
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-			data["wheel_content"] = zip_file.namelist()
-
-			assert zip_file.read_text("whey/__init__.py") == "print('hello world')\n"
-			assert zip_file.read_text("whey/style.css") == "This is the style.css file\n"
-			advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
-
-	with tempfile.TemporaryDirectory() as tmpdir:
-		sdist_builder = SDistBuilder(
-				project_dir=tmp_pathplus,
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				)
-		sdist = sdist_builder.build_sdist()
-		assert (tmp_pathplus / sdist).is_file()
-
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
-			data["sdist_content"] = sorted(tar.getnames())
-
-			assert tar.read_text("whey-2021.0.0/src/whey/__init__.py") == "print('hello world')\n"
-			assert tar.read_text("whey-2021.0.0/src/whey/style.css") == "This is the style.css file\n"
-			assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
-			assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
-			assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+	wheel_builder = make_builder(
+			WheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = zip_file.namelist()
+
+		assert zip_file.read_text("whey/__init__.py") == "print('hello world')\n"
+		assert zip_file.read_text("whey/style.css") == "This is the style.css file\n"
+		advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/METADATA"))
+
+	sdist_builder = make_builder(
+			SDistBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_2", verbose=True
+			)
+	sdist = sdist_builder.build_sdist()
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
+		data["sdist_content"] = sorted(tar.getnames())
+
+		assert tar.read_text("whey-2021.0.0/src/whey/__init__.py") == "print('hello world')\n"
+		assert tar.read_text("whey-2021.0.0/src/whey/style.css") == "This is the style.css file\n"
+		assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
+		assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
+		assert tar.read_text("whey-2021.0.0/requirements.txt") == "domdf_python_tools\n"
+
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
 
 
-@pytest.mark.usefixtures("fixed_whey_version")
+@pytest.mark.usefixtures("fixed_whey_version", "project_skeleton")
 @pytest.mark.parametrize(
 		"config",
 		[
 				# pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
 				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS"),
+				pytest.param(COMPLETE_B, id="COMPLETE_B", marks=pytest.mark.slow),
+				pytest.param(LONG_REQUIREMENTS, id="LONG_REQUIREMENTS", marks=pytest.mark.slow),
 				]
 		)
 def test_custom_wheel_builder(
@@ -1254,12 +1043,9 @@ def test_custom_wheel_builder(
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world')")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_pyproject(tmp_pathplus, config)
+
+	project_config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	data: Dict[str, Any] = {}
 
@@ -1269,24 +1055,16 @@ def test_custom_wheel_builder(
 		def generator(self) -> str:
 			return "My Custom Builder v1.2.3"
 
-	with tempfile.TemporaryDirectory() as tmpdir:
-		wheel_builder = CustomWheelBuilder(
-				project_dir=tmp_pathplus,
-				config=load_toml(tmp_pathplus / "pyproject.toml"),
-				build_dir=tmpdir,
-				out_dir=tmp_pathplus,
-				verbose=True,
-				colour=False,
-				)
+	wheel_builder = make_builder(
+			CustomWheelBuilder, tmp_pathplus, project_config, tmp_pathplus / "build_1", verbose=True
+			)
 
-		wheel = wheel_builder.build_wheel()
-		data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel, advanced_file_regression)
+	wheel = wheel_builder.build_wheel()
+	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+		data["wheel_content"] = check_built_wheel(zip_file, advanced_file_regression)
 
-		with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
-			advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/WHEEL"), extension=".WHEEL")
+		advanced_file_regression.check(zip_file.read_text("whey-2021.0.0.dist-info/WHEEL"), extension=".WHEEL")
 
-	outerr = capsys.readouterr()
-	data["stdout"] = outerr.out.replace(tmp_pathplus.as_posix(), "...")
-	data["stderr"] = outerr.err
+	data.update(get_output(capsys, tmp_pathplus))
 
 	advanced_data_regression.check(data)
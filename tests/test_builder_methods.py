@@ -1,5 +1,6 @@
 # stdlib
 import sys
+import zipfile
 from typing import TYPE_CHECKING, Any, Dict
 
 # 3rd party
@@ -10,6 +11,7 @@ from domdf_python_tools.paths import PathPlus, TemporaryPathPlus, sort_paths
 
 # this package
 from tests.example_configs import COMPLETE_A
+from tests.utils import write_files
 from whey.builder import WheelBuilder
 from whey.config import load_toml
 
@@ -31,11 +33,12 @@ def test_create_editables_files(
 		editables_version: str,
 		):
 	(tmp_pathplus / "pyproject.toml").write_clean(COMPLETE_A)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"whey/__init__.py": "print('hello world)\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
 
 	data: Dict[str, Any] = {}
 
@@ -64,3 +67,18 @@ def test_create_editables_files(
 			data["code"] = (tmpdir / "_whey.py").read_text().replace(tmp_pathplus.as_posix(), "...")
 
 	advanced_data_regression.check(data)
+
+
+@pytest.mark.parametrize(
+		"no_compress, expected",
+		[
+				pytest.param('0', zipfile.ZIP_DEFLATED, id="deflated"),
+				pytest.param('1', zipfile.ZIP_STORED, id="stored"),
+				]
+		)
+def test_get_compression(monkeypatch, no_compress: str, expected: int):
+	monkeypatch.setenv("WHEY_NO_COMPRESS", no_compress)
+	assert WheelBuilder.get_compression() == expected
+
+	monkeypatch.delenv("WHEY_NO_COMPRESS")
+	assert WheelBuilder.get_compression() == zipfile.ZIP_DEFLATED
@@ -2,7 +2,7 @@
 import re
 import sys
 import textwrap
-from typing import TYPE_CHECKING, Any, Dict, List, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Type
 
 # 3rd party
 import handy_archives
@@ -28,7 +28,14 @@ from re_assert import Matches  # type: ignore[import]
 
 # this package
 import whey
-from tests.example_configs import COMPLETE_A, COMPLETE_B
+from tests.example_configs import (
+		COMPLETE_A,
+		COMPLETE_B,
+		MINIMAL_DESCRIPTION,
+		MINIMAL_REQUIRES_PYTHON,
+		MINIMAL_REQUIRES_PYTHON_COMPLEX
+		)
+from tests.utils import link_files, write_files, write_pyproject
 from whey.__main__ import main
 
 if TYPE_CHECKING:
@@ -36,16 +43,25 @@ if TYPE_CHECKING:
 	from _pytest.capture import CaptureFixture
 
 
+@pytest.fixture()
+def spam_project(request, tmp_pathplus: PathPlus) -> PathPlus:
+	"""
+	Populate ``tmp_pathplus`` with a ``spam`` project, using the parameter as its ``pyproject.toml``.
+	"""
+
+	write_pyproject(tmp_pathplus, request.param)
+	write_files(tmp_pathplus, {"spam/__init__.py": "print('hello world)\n"})
+
+	return tmp_pathplus
+
+
 @pytest.mark.parametrize(
-		"config",
+		"spam_project",
 		[
 				pytest.param(MINIMAL_CONFIG, id="minimal"),
-				pytest.param(f'{MINIMAL_CONFIG}\ndescription = "Lovely Spam! Wonderful Spam!"', id="description"),
-				pytest.param(f'{MINIMAL_CONFIG}\nrequires-python = ">=3.8"', id="requires-python"),
-				pytest.param(
-						f'{MINIMAL_CONFIG}\nrequires-python = ">=2.7,!=3.0.*,!=3.2.*"',
-						id="requires-python_complex"
-						),
+				pytest.param(MINIMAL_DESCRIPTION, id="description"),
+				pytest.param(MINIMAL_REQUIRES_PYTHON, id="requires-python"),
+				pytest.param(MINIMAL_REQUIRES_PYTHON_COMPLEX, id="requires-python_complex"),
 				pytest.param(KEYWORDS, id="keywords"),
 				pytest.param(AUTHORS, id="authors"),
 				pytest.param(MAINTAINERS, id="maintainers"),
@@ -54,45 +70,71 @@ if TYPE_CHECKING:
 				pytest.param(OPTIONAL_DEPENDENCIES, id="optional-dependencies"),
 				pytest.param(URLS, id="urls"),
 				pytest.param(ENTRY_POINTS, id="entry_points"),
-				]
+				],
+		indirect=True,
 		)
 def test_cli_build_success(
-		config: str,
-		tmp_pathplus: PathPlus,
+		spam_project: PathPlus,
+		cli_runner: CliRunner,
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "spam").mkdir()
-	(tmp_pathplus / "spam" / "__init__.py").write_clean("print('hello world)")
-
 	data: Dict[str, Any] = {}
 
-	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(main, args=["--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)])
+	with in_directory(spam_project):
+		result: Result = cli_runner.invoke(main, args=["--verbose", "--no-colour", "--out-dir", str(spam_project)])
 
 	assert result.exit_code == 0
 
 	wheel = "spam-2020.0.0-py3-none-any.whl"
-	assert (tmp_pathplus / wheel).is_file()
+	assert (spam_project / wheel).is_file()
 
-	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
+	with handy_archives.ZipFile(spam_project / wheel) as zip_file:
 		data["wheel_content"] = sorted(zip_file.namelist())
 		assert zip_file.read_text("spam/__init__.py") == "print('hello world)\n"
 
 	sdist = "spam-2020.0.0.tar.gz"
-	assert (tmp_pathplus / sdist).is_file()
+	assert (spam_project / sdist).is_file()
 
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+	with handy_archives.TarFile.open(spam_project / sdist, mode="r:gz") as tar:
 		data["sdist_content"] = sorted(tar.getnames())
 		assert tar.read_text("spam-2020.0.0/spam/__init__.py") == "print('hello world)\n"
 
-	data["stdout"] = result.stdout.rstrip().replace(tmp_pathplus.as_posix(), "...")
+	data["stdout"] = result.stdout.rstrip().replace(spam_project.as_posix(), "...")
 
 	advanced_data_regression.check(data)
 
 
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+	# The runner holds no state between invocations, so one instance serves every test.
+	return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def complete_project_templates(tmp_path_factory) -> Dict[str, PathPlus]:
+	"""
+	A project directory for each of ``COMPLETE_A`` and ``COMPLETE_B``, keyed by the configuration.
+
+	Each is written once per session and linked into the tests' temporary directories with :func:`~.link_files`.
+	"""
+
+	templates = {}
+
+	for config in (COMPLETE_A, COMPLETE_B):
+		template_dir = PathPlus(tmp_path_factory.mktemp("complete_project"))
+		write_pyproject(template_dir, config)
+		write_files(template_dir, {
+				"whey/__init__.py": "print('hello world)\n",
+				"README.rst": "Spam Spam Spam Spam\n",
+				"LICENSE": "This is the license\n",
+				"requirements.txt": "domdf_python_tools\n",
+				})
+		templates[config] = template_dir
+
+	return templates
+
+
 def check_built_wheel(filename: PathPlus) -> List[str]:
 	assert (filename).is_file()
 
@@ -105,7 +147,7 @@ def check_built_wheel(filename: PathPlus) -> List[str]:
 def check_built_sdist(filename: PathPlus) -> List[str]:
 	assert (filename).is_file()
 
-	with handy_archives.TarFile.open(filename) as tar:
+	with handy_archives.TarFile.open(filename, mode="r:gz") as tar:
 		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world)\n"
 		assert tar.read_text("whey-2021.0.0/README.rst") == "Spam Spam Spam Spam\n"
 		assert tar.read_text("whey-2021.0.0/LICENSE") == "This is the license\n"
@@ -114,7 +156,7 @@ def check_built_sdist(filename: PathPlus) -> List[str]:
 		return sorted(tar.getnames())
 
 
-@pytest.mark.parametrize(
+complete_configs = pytest.mark.parametrize(
 		"config",
 		[
 				# pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
@@ -122,222 +164,150 @@ def check_built_sdist(filename: PathPlus) -> List[str]:
 				pytest.param(COMPLETE_B, id="COMPLETE_B"),
 				]
 		)
-def test_build_complete(
-		config: str,
+
+
+def build_complete(
+		cli_runner: CliRunner,
 		tmp_pathplus: PathPlus,
-		advanced_data_regression: AdvancedDataRegressionFixture,
-		capsys: "CaptureFixture[str]",
-		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+		args: List[str],
+		*,
+		wheel: bool,
+		sdist: bool,
+		) -> Dict[str, Any]:
+	"""
+	Run ``whey`` with the given ``args`` in ``tmp_pathplus`` and check the archives it builds.
+
+	:returns: The data for the regression check.
+	"""
 
 	data: Dict[str, Any] = {}
 
 	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(main, args=["--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)])
+		result: Result = cli_runner.invoke(
+				main, args=[*args, "--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)]
+				)
 
 	assert result.exit_code == 0
 
-	wheel = "whey-2021.0.0-py3-none-any.whl"
-	data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel)
+	if wheel:
+		data["wheel_content"] = check_built_wheel(tmp_pathplus / "whey-2021.0.0-py3-none-any.whl")
 
-	sdist = "whey-2021.0.0.tar.gz"
-	data["sdist_content"] = check_built_sdist(tmp_pathplus / sdist)
+	if sdist:
+		data["sdist_content"] = check_built_sdist(tmp_pathplus / "whey-2021.0.0.tar.gz")
 
 	data["stdout"] = result.stdout.rstrip().replace(tmp_pathplus.as_posix(), "...")
 
-	advanced_data_regression.check(data)
+	return data
 
 
-@pytest.mark.parametrize(
-		"config", [
-				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				]
-		)
-def test_build_sdist_complete(
+@complete_configs
+def test_build_complete(
 		config: str,
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
+		complete_project_templates: Dict[str, PathPlus],
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
-
-	data: Dict[str, Any] = {}
-
-	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(
-				main, args=["--sdist", "--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)]
-				)
-
-	assert result.exit_code == 0
-
-	sdist = "whey-2021.0.0.tar.gz"
-	data["sdist_content"] = check_built_sdist(tmp_pathplus / sdist)
+	link_files(complete_project_templates[config], tmp_pathplus)
+	data = build_complete(cli_runner, tmp_pathplus, [], wheel=True, sdist=True)
+	advanced_data_regression.check(data)
 
-	data["stdout"] = result.stdout.rstrip().replace(tmp_pathplus.as_posix(), "...")
 
+@complete_configs
+def test_build_sdist_complete(
+		config: str,
+		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
+		complete_project_templates: Dict[str, PathPlus],
+		advanced_data_regression: AdvancedDataRegressionFixture,
+		capsys: "CaptureFixture[str]",
+		):
+	link_files(complete_project_templates[config], tmp_pathplus)
+	data = build_complete(cli_runner, tmp_pathplus, ["--sdist"], wheel=False, sdist=True)
 	advanced_data_regression.check(data)
 
 
-@pytest.mark.parametrize(
-		"config", [
-				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				]
-		)
+@complete_configs
 def test_build_wheel_complete(
 		config: str,
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
+		complete_project_templates: Dict[str, PathPlus],
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
-
-	data: Dict[str, Any] = {}
-
-	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(
-				main, args=["--wheel", "--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)]
-				)
-
-	assert result.exit_code == 0
-
-	wheel = "whey-2021.0.0-py3-none-any.whl"
-	data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel)
-
-	data["stdout"] = result.stdout.rstrip().replace(tmp_pathplus.as_posix(), "...")
-
+	link_files(complete_project_templates[config], tmp_pathplus)
+	data = build_complete(cli_runner, tmp_pathplus, ["--wheel"], wheel=True, sdist=False)
 	advanced_data_regression.check(data)
 
 
-@pytest.mark.parametrize(
-		"config", [
-				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				]
-		)
+@complete_configs
 def test_build_wheel_via_builder_complete(
 		config: str,
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
+		complete_project_templates: Dict[str, PathPlus],
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
-
-	data: Dict[str, Any] = {}
-
-	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(
-				main, args=["--builder", "whey_wheel", "--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)]
-				)
-
-	assert result.exit_code == 0
-
-	wheel = "whey-2021.0.0-py3-none-any.whl"
-	data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel)
-
-	data["stdout"] = result.stdout.rstrip().replace(tmp_pathplus.as_posix(), "...")
-
+	link_files(complete_project_templates[config], tmp_pathplus)
+	data = build_complete(cli_runner, tmp_pathplus, ["--builder", "whey_wheel"], wheel=True, sdist=False)
 	advanced_data_regression.check(data)
 
 
-@pytest.mark.parametrize(
-		"config", [
-				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				]
-		)
+@complete_configs
 def test_build_binary_complete(
 		config: str,
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
+		complete_project_templates: Dict[str, PathPlus],
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
 
 	# TODO: e.g. conda, RPM, DEB
 
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
-
-	data: Dict[str, Any] = {}
-
-	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(
-				main, args=["--binary", "--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)]
-				)
-
-	assert result.exit_code == 0
-
-	wheel = "whey-2021.0.0-py3-none-any.whl"
-	data["wheel_content"] = check_built_wheel(tmp_pathplus / wheel)
-
-	data["stdout"] = result.stdout.rstrip().replace(tmp_pathplus.as_posix(), "...")
-
+	link_files(complete_project_templates[config], tmp_pathplus)
+	data = build_complete(cli_runner, tmp_pathplus, ["--binary"], wheel=True, sdist=False)
 	advanced_data_regression.check(data)
 
 
 def test_build_additional_files(
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
+		complete_project_templates: Dict[str, PathPlus],
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		capsys: "CaptureFixture[str]",
 		):
 
-	(tmp_pathplus / "pyproject.toml").write_lines([
-			COMPLETE_B,
-			'',
-			"additional-files = [",
-			'  "include whey/style.css",',
-			'  "exclude whey/style.css",',
-			'  "include whey/style.css",',
-			'  "recursive-include whey/static *",',
-			'  "recursive-exclude whey/static *.txt",',
-			']',
-			])
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "whey" / "style.css").write_clean("This is the style.css file")
-	(tmp_pathplus / "whey" / "static").mkdir()
-	(tmp_pathplus / "whey" / "static" / "foo.py").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.c").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.txt").touch()
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	# The template's pyproject.toml is replaced, not modified in place, by write_pyproject().
+	link_files(complete_project_templates[COMPLETE_B], tmp_pathplus)
+	write_pyproject(
+			tmp_pathplus,
+			'\n'.join([
+					COMPLETE_B,
+					'',
+					"additional-files = [",
+					'  "include whey/style.css",',
+					'  "exclude whey/style.css",',
+					'  "include whey/style.css",',
+					'  "recursive-include whey/static *",',
+					'  "recursive-exclude whey/static *.txt",',
+					']',
+					]),
+			)
+	write_files(tmp_pathplus, {
+			"whey/style.css": "This is the style.css file\n",
+			"whey/static/foo.py": "",
+			"whey/static/foo.c": "",
+			"whey/static/foo.txt": "",
+			})
 
 	data: Dict[str, Any] = {}
 
 	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(main, args=["--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)])
+		result: Result = cli_runner.invoke(main, args=["--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)])
 
 	assert result.exit_code == 0
 
@@ -353,7 +323,7 @@ def test_build_additional_files(
 	sdist = "whey-2021.0.0.tar.gz"
 	assert (tmp_pathplus / sdist).is_file()
 
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
 		data["sdist_content"] = sorted(tar.getnames())
 
 		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world)\n"
@@ -482,12 +452,12 @@ def test_bad_config(
 		config: str,
 		match: str,
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
+	write_pyproject(tmp_pathplus, config)
 
 	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(
+		result: Result = cli_runner.invoke(
 				main,
 				args=["--sdist", "--verbose", "--no-colour", "--out-dir", str(tmp_pathplus)],
 				)
@@ -507,7 +477,7 @@ class _Matches(Matches):
 		pos, bound = 0, len(fail)
 		while pos < bound:
 			pivot = pos + (bound - pos + 1) // 2
-			match = self._pattern.match(fail[:pivot], partial=True)
+			match = self._pattern.match(fail, 0, pivot, partial=True)
 			if match:
 				pos = pivot
 			else:
@@ -546,19 +516,41 @@ def test_bad_config_show_traceback(
 		exception: Type[Exception],
 		match: str,
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
+	write_pyproject(tmp_pathplus, config)
 
 	with in_directory(tmp_pathplus):
-		runner = CliRunner()
 
 		with pytest.raises(exception, match=match):
-			runner.invoke(
+			cli_runner.invoke(
 					main,
 					args=["--sdist", "--verbose", "--no-colour", "--out-dir", str(tmp_pathplus), "-T"],
 					)
 
 
+@pytest.fixture(scope="module")
+def show_builders_projects(tmp_path_factory) -> Callable[[str], PathPlus]:
+	"""
+	Returns a function which gives a project directory containing the given ``pyproject.toml``.
+
+	``--show-builders`` exits before building anything,
+	so each configuration is written once and shared between all of its ``args``.
+	"""
+
+	projects: Dict[str, PathPlus] = {}
+
+	def get_project(config: str) -> PathPlus:
+		if config not in projects:
+			project_dir = PathPlus(tmp_path_factory.mktemp("show_builders"))
+			write_pyproject(project_dir, config)
+			projects[config] = project_dir
+
+		return projects[config]
+
+	return get_project
+
+
 @pytest.mark.parametrize(
 		"config",
 		[
@@ -592,15 +584,13 @@ def test_bad_config_show_traceback(
 		)
 def test_show_builders(
 		config: str,
-		tmp_pathplus: PathPlus,
+		show_builders_projects: Callable[[str], PathPlus],
+		cli_runner: CliRunner,
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		args: List[str]
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
-
-	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(
+	with in_directory(show_builders_projects(config)):
+		result: Result = cli_runner.invoke(
 				main,
 				args=[*args, "--show-builders", "--no-colour"],
 				)
@@ -611,13 +601,13 @@ def test_show_builders(
 
 def test_show_builders_error(
 		tmp_pathplus: PathPlus,
+		cli_runner: CliRunner,
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(MINIMAL_CONFIG)
+	write_pyproject(tmp_pathplus, MINIMAL_CONFIG)
 
 	with in_directory(tmp_pathplus):
-		runner = CliRunner()
-		result: Result = runner.invoke(
+		result: Result = cli_runner.invoke(
 				main,
 				args=["--builder", "foo", "--show-builders", "--no-colour"],
 				)
@@ -626,14 +616,11 @@ def test_show_builders_error(
 	assert result.exit_code == 2
 
 
-def test_version():
-
-	runner = CliRunner()
-
-	result = runner.invoke(main, catch_exceptions=False, args="--version")
+def test_version(cli_runner: CliRunner):
+	result = cli_runner.invoke(main, catch_exceptions=False, args="--version")
 	assert result.exit_code == 0
 	assert result.stdout == f"whey version {whey.__version__}\n"
 
-	result = runner.invoke(main, catch_exceptions=False, args=["--version", "--version"])
+	result = cli_runner.invoke(main, catch_exceptions=False, args=["--version", "--version"])
 	assert result.exit_code == 0
 	assert result.stdout == f"whey version {whey.__version__}, Python {sys.version.replace(LF, ' ')}\n"
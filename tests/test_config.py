@@ -30,6 +30,12 @@ from shippinglabel.requirements import ComparableRequirement
 from typing_extensions import TypedDict
 
 # this package
+from tests.example_configs import (
+		MINIMAL_DESCRIPTION,
+		MINIMAL_REQUIRES_PYTHON,
+		MINIMAL_REQUIRES_PYTHON_COMPLEX
+		)
+from tests.utils import write_pyproject
 from whey.builder import AbstractBuilder
 from whey.config import PEP621Parser, backfill_classifiers, load_toml
 
@@ -174,6 +180,21 @@ additional-files = [
 		)
 
 
+def stringify_config(config: Dict[str, Any]) -> None:
+	"""
+	Convert the requirements, versions and specifiers in ``config`` to strings, in place.
+	"""
+
+	if "dependencies" in config:
+		config["dependencies"] = list(map(str, config["dependencies"]))
+	if "optional-dependencies" in config:
+		config["optional-dependencies"] = {k: list(map(str, v)) for k, v in config["optional-dependencies"].items()}
+	if "requires-python" in config and config["requires-python"] is not None:
+		config["requires-python"] = str(config["requires-python"])
+	if "version" in config and config["version"] is not None:
+		config["version"] = str(config["version"])
+
+
 def check_config(
 		config: Dict[str, Any],
 		data_regression: AdvancedDataRegressionFixture,
@@ -183,36 +204,35 @@ def check_config(
 	assert all(isinstance(name, str) for name in builders)
 	assert all(issubclass(name, AbstractBuilder) for name in builders.values())
 
-	if "requires-python" in config and config["requires-python"] is not None:
-		config["requires-python"] = str(config["requires-python"])
-	if "version" in config and config["version"] is not None:
-		config["version"] = str(config["version"])
-
+	stringify_config(config)
 	data_regression.check(config)
 
 
+# Shared by the load_toml and PEP621Parser tests.
+_valid_configs = [
+		pytest.param(MINIMAL_CONFIG, id="minimal"),
+		pytest.param(MINIMAL_DESCRIPTION, id="description"),
+		pytest.param(MINIMAL_REQUIRES_PYTHON, id="requires-python"),
+		pytest.param(MINIMAL_REQUIRES_PYTHON_COMPLEX, id="requires-python_complex"),
+		pytest.param(KEYWORDS, id="keywords"),
+		pytest.param(AUTHORS, id="authors"),
+		pytest.param(MAINTAINERS, id="maintainers"),
+		pytest.param(CLASSIFIERS, id="classifiers"),
+		pytest.param(DEPENDENCIES, id="dependencies"),
+		pytest.param(OPTIONAL_DEPENDENCIES, id="optional-dependencies"),
+		pytest.param(URLS, id="urls"),
+		pytest.param(ENTRY_POINTS, id="entry_points"),
+		pytest.param(UNICODE, id="unicode"),
+		pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
+		pytest.param(COMPLETE_A, id="COMPLETE_A"),
+		pytest.param(COMPLETE_B, id="COMPLETE_B"),
+		]
+
+
 @pytest.mark.parametrize(
 		"toml_config",
 		[
-				pytest.param(MINIMAL_CONFIG, id="minimal"),
-				pytest.param(f'{MINIMAL_CONFIG}\ndescription = "Lovely Spam! Wonderful Spam!"', id="description"),
-				pytest.param(f'{MINIMAL_CONFIG}\nrequires-python = ">=3.8"', id="requires-python"),
-				pytest.param(
-						f'{MINIMAL_CONFIG}\nrequires-python = ">=2.7,!=3.0.*,!=3.2.*"',
-						id="requires-python_complex"
-						),
-				pytest.param(KEYWORDS, id="keywords"),
-				pytest.param(AUTHORS, id="authors"),
-				pytest.param(MAINTAINERS, id="maintainers"),
-				pytest.param(CLASSIFIERS, id="classifiers"),
-				pytest.param(DEPENDENCIES, id="dependencies"),
-				pytest.param(OPTIONAL_DEPENDENCIES, id="optional-dependencies"),
-				pytest.param(URLS, id="urls"),
-				pytest.param(ENTRY_POINTS, id="entry_points"),
-				pytest.param(UNICODE, id="unicode"),
-				pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
-				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
+				*_valid_configs,
 				pytest.param(COMPLETE_B_ADDITIONAL_FILES, id="COMPLETE_B_ADDITIONAL_FILES"),
 				]
 		)
@@ -221,14 +241,8 @@ def test_parse_valid_config(
 		tmp_pathplus: PathPlus,
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		):
-	(tmp_pathplus / "pyproject.toml").write_clean(toml_config)
+	write_pyproject(tmp_pathplus, toml_config)
 	config = load_toml(tmp_pathplus / "pyproject.toml")
-
-	if "dependencies" in config:
-		config["dependencies"] = list(map(str, config["dependencies"]))
-	if "optional-dependencies" in config:
-		config["optional-dependencies"] = {k: list(map(str, v)) for k, v in config["optional-dependencies"].items()}
-
 	check_config(config, advanced_data_regression)
 
 
@@ -256,37 +270,14 @@ ProjectDictPureClasses = TypedDict(
 		)
 
 
-@pytest.mark.parametrize(
-		"toml_config",
-		[
-				pytest.param(MINIMAL_CONFIG, id="minimal"),
-				pytest.param(f'{MINIMAL_CONFIG}\ndescription = "Lovely Spam! Wonderful Spam!"', id="description"),
-				pytest.param(f'{MINIMAL_CONFIG}\nrequires-python = ">=3.8"', id="requires-python"),
-				pytest.param(
-						f'{MINIMAL_CONFIG}\nrequires-python = ">=2.7,!=3.0.*,!=3.2.*"',
-						id="requires-python_complex"
-						),
-				pytest.param(KEYWORDS, id="keywords"),
-				pytest.param(AUTHORS, id="authors"),
-				pytest.param(MAINTAINERS, id="maintainers"),
-				pytest.param(CLASSIFIERS, id="classifiers"),
-				pytest.param(DEPENDENCIES, id="dependencies"),
-				pytest.param(OPTIONAL_DEPENDENCIES, id="optional-dependencies"),
-				pytest.param(URLS, id="urls"),
-				pytest.param(ENTRY_POINTS, id="entry_points"),
-				pytest.param(UNICODE, id="unicode"),
-				pytest.param(COMPLETE_PROJECT_A, id="COMPLETE_PROJECT_A"),
-				pytest.param(COMPLETE_A, id="COMPLETE_A"),
-				pytest.param(COMPLETE_B, id="COMPLETE_B"),
-				]
-		)
+@pytest.mark.parametrize("toml_config", _valid_configs)
 def test_pep621_class_valid_config(
 		toml_config: str,
 		tmp_pathplus: PathPlus,
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		):
 
-	(tmp_pathplus / "pyproject.toml").write_clean(toml_config)
+	write_pyproject(tmp_pathplus, toml_config)
 
 	with in_directory(tmp_pathplus):
 		config = cast(
@@ -294,16 +285,7 @@ def test_pep621_class_valid_config(
 				PEP621Parser().parse(dom_toml.load(tmp_pathplus / "pyproject.toml")["project"]),
 				)
 
-	if "dependencies" in config:
-		config["dependencies"] = list(map(str, config["dependencies"]))
-	if "optional-dependencies" in config:
-		config["optional-dependencies"] = {k: list(map(str, v)) for k, v in config["optional-dependencies"].items()}
-
-	if "requires-python" in config and config["requires-python"] is not None:
-		config["requires-python"] = str(config["requires-python"])
-	if "version" in config and config["version"] is not None:
-		config["version"] = str(config["version"])
-
+	stringify_config(cast(Dict[str, Any], config))
 	advanced_data_regression.check(config)
 
 
@@ -501,18 +483,32 @@ wheel = "whey_wheel"
 
 """
 			)
-	(tmp_pathplus / "pyproject.toml").write_clean(toml_config)
+	write_pyproject(tmp_pathplus, toml_config)
 	config = load_toml(tmp_pathplus / "pyproject.toml")
 
 	check_config(config, advanced_data_regression)
 
 
-def test_parse_dynamic_requirements(
-		tmp_pathplus: PathPlus,
-		advanced_data_regression: AdvancedDataRegressionFixture,
-		):
-	toml_config = dedent(
-			"""
+def test_load_toml_results_independent(tmp_pathplus: PathPlus):
+	# The test suite caches parsed files (see tests/utils.py), so make sure results stay independent.
+	write_pyproject(
+			tmp_pathplus,
+			f'{MINIMAL_CONFIG}\ndependencies = ["httpx"]\n\n[tool.whey]\nbase-classifiers = ["Typing :: Typed"]',
+			)
+
+	first = load_toml(tmp_pathplus / "pyproject.toml")
+	first["dependencies"].append(ComparableRequirement("django"))
+	first["base-classifiers"].append("Development Status :: 4 - Beta")
+	first["package"] = "eggs"
+
+	second = load_toml(tmp_pathplus / "pyproject.toml")
+	assert second["dependencies"] == [ComparableRequirement("httpx")]
+	assert second["base-classifiers"] == ["Typing :: Typed"]
+	assert second["package"] == "spam"
+
+
+_dynamic_requirements_config = dedent(
+		"""
 [project]
 name = "whey"
 version = "2021.0.0"
@@ -527,8 +523,14 @@ python-implementations = [ "CPython", "PyPy",]
 platforms = [ "Windows", "macOS", "Linux",]
 license-key = "MIT"
 """
-			)
-	(tmp_pathplus / "pyproject.toml").write_clean(toml_config)
+		)
+
+
+def test_parse_dynamic_requirements(
+		tmp_pathplus: PathPlus,
+		advanced_data_regression: AdvancedDataRegressionFixture,
+		):
+	write_pyproject(tmp_pathplus, _dynamic_requirements_config)
 	(tmp_pathplus / "requirements.txt").write_lines([
 			"apeye>=0.7.0",
 			"click>=7.1.2",
@@ -544,32 +546,11 @@ license-key = "MIT"
 			])
 
 	config = load_toml(tmp_pathplus / "pyproject.toml")
-
-	if "dependencies" in config:
-		config["dependencies"] = list(map(str, config["dependencies"]))
-
 	check_config(config, advanced_data_regression)
 
 
 def test_parse_dynamic_requirements_invalid(tmp_pathplus: PathPlus, ):
-	toml_config = dedent(
-			"""
-[project]
-name = "whey"
-version = "2021.0.0"
-description = "A simple Python wheel builder for simple projects."
-keywords = [ "pep517", "pep621", "build", "sdist", "wheel", "packaging", "distribution",]
-dynamic = [ "classifiers", "requires-python", "dependencies",]
-
-[tool.whey]
-base-classifiers = [ "Development Status :: 4 - Beta",]
-python-versions = [ "3.6", "3.7", "3.8", "3.9", "3.10",]
-python-implementations = [ "CPython", "PyPy",]
-platforms = [ "Windows", "macOS", "Linux",]
-license-key = "MIT"
-"""
-			)
-	(tmp_pathplus / "pyproject.toml").write_clean(toml_config)
+	write_pyproject(tmp_pathplus, _dynamic_requirements_config)
 	(tmp_pathplus / "requirements.txt").write_lines([
 			"apeye>=0.7.0",
 			"# a comment",
@@ -649,40 +630,35 @@ def test_bad_config_license(
 		load_toml(tmp_pathplus / "pyproject.toml")
 
 
+# Shared by the load_toml and PEP621Parser tests.
+_bad_pep621_configs = [
+		pytest.param(
+				'[project]\nname = "spam"',
+				BadConfigError,
+				"The 'project.version' field must be provided.",
+				id="no_version"
+				),
+		*bad_pep621_config,
+		]
+
+
 @pytest.mark.parametrize(
 		"config, expects, match",
 		[
 				pytest.param('', KeyError, "'project' table not found in '.*'", id="no_config"),
-				pytest.param(
-						'[project]\nname = "spam"',
-						BadConfigError,
-						"The 'project.version' field must be provided.",
-						id="no_version"
-						),
-				*bad_pep621_config,
+				*_bad_pep621_configs,
 				]
 		)
 def test_parse_config_errors(config: str, expects: Type[Exception], match: str, tmp_pathplus: PathPlus):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
+	write_pyproject(tmp_pathplus, config)
 
 	with pytest.raises(expects, match=match):
 		load_toml(tmp_pathplus / "pyproject.toml")
 
 
-@pytest.mark.parametrize(
-		"config, expects, match",
-		[
-				pytest.param(
-						'[project]\nname = "spam"',
-						BadConfigError,
-						"The 'project.version' field must be provided.",
-						id="no_version"
-						),
-				*bad_pep621_config,
-				]
-		)
+@pytest.mark.parametrize("config, expects, match", _bad_pep621_configs)
 def test_pep621parser_class_errors(config: str, expects: Type[Exception], match: str, tmp_pathplus: PathPlus):
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
+	write_pyproject(tmp_pathplus, config)
 
 	with in_directory(tmp_pathplus), pytest.raises(expects, match=match):
 		PEP621Parser().parse(dom_toml.load(tmp_pathplus / "pyproject.toml")["project"])
@@ -696,7 +672,7 @@ name = "spam"
 version = "2020.0.0"
 readme = "{filename}"
 """)
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
+	write_pyproject(tmp_pathplus, config)
 	(tmp_pathplus / filename).write_text("This is the readme.")
 
 	with pytest.raises(ValueError, match=f"Unsupported extension for '{filename}'"):
@@ -805,7 +781,7 @@ def test_bad_config_dynamic(
 		tmp_pathplus: PathPlus,
 		):
 
-	(tmp_pathplus / "pyproject.toml").write_clean(config)
+	write_pyproject(tmp_pathplus, config)
 
 	with pytest.raises(BadConfigError, match=match):
 		load_toml(tmp_pathplus / "pyproject.toml")
@@ -889,7 +865,7 @@ def test_bad_config_whey_table(
 		tmp_pathplus: PathPlus,
 		):
 
-	(tmp_pathplus / "pyproject.toml").write_clean(f"{MINIMAL_CONFIG}\n[tool.whey]\n{config}")
+	write_pyproject(tmp_pathplus, f"{MINIMAL_CONFIG}\n[tool.whey]\n{config}")
 
 	with pytest.raises(exception, match=match):
 		load_toml(tmp_pathplus / "pyproject.toml")
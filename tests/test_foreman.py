@@ -12,6 +12,7 @@ from pytest_regressions.file_regression import FileRegressionFixture
 
 # this package
 from tests.example_configs import COMPLETE_A, COMPLETE_B
+from tests.utils import write_files
 from whey.foreman import Foreman
 
 if TYPE_CHECKING:
@@ -27,8 +28,7 @@ def test_build_success(
 		capsys: "CaptureFixture[str]",
 		):
 	(tmp_pathplus / "pyproject.toml").write_clean(good_config)
-	(tmp_pathplus / "spam").mkdir()
-	(tmp_pathplus / "spam" / "__init__.py").write_clean("print('hello world)")
+	write_files(tmp_pathplus, {"spam/__init__.py": "print('hello world)\n"})
 
 	data: Dict[str, Any] = {}
 
@@ -58,7 +58,7 @@ def test_build_success(
 				)
 		assert (tmp_pathplus / sdist).is_file()
 
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+		with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
 			data["sdist_content"] = sorted(tar.getnames())
 			assert tar.read_text("spam-2020.0.0/spam/__init__.py") == "print('hello world)\n"
 
@@ -86,11 +86,12 @@ def test_build_complete(
 		capsys: "CaptureFixture[str]",
 		):
 	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"whey/__init__.py": "print('hello world)\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
 
 	data: Dict[str, Any] = {}
 
@@ -120,7 +121,7 @@ def test_build_complete(
 				)
 		assert (tmp_pathplus / sdist).is_file()
 
-		with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+		with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
 			data["sdist_content"] = sorted(tar.getnames())
 
 			assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world)\n"
@@ -153,16 +154,16 @@ def test_build_additional_files(
 			'  "recursive-exclude whey/static *.txt",',
 			']',
 			])
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "whey" / "style.css").write_clean("This is the style.css file")
-	(tmp_pathplus / "whey" / "static").mkdir()
-	(tmp_pathplus / "whey" / "static" / "foo.py").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.c").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.txt").touch()
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"whey/__init__.py": "print('hello world)\n",
+			"whey/style.css": "This is the style.css file\n",
+			"whey/static/foo.py": "",
+			"whey/static/foo.c": "",
+			"whey/static/foo.txt": "",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
 
 	data: Dict[str, Any] = {}
 
@@ -186,7 +187,7 @@ def test_build_additional_files(
 	sdist = foreman.build_sdist(out_dir=tmp_pathplus, verbose=True, colour=False)
 	assert (tmp_pathplus / sdist).is_file()
 
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
 		data["sdist_content"] = sorted(tar.getnames())
 
 		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world)\n"
@@ -1,5 +1,6 @@
 # stdlib
 import sys
+import zipfile
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 # 3rd party
@@ -22,6 +23,12 @@ from pyproject_examples.example_configs import (
 
 # this package
 import whey
+from tests.example_configs import (
+		MINIMAL_DESCRIPTION,
+		MINIMAL_REQUIRES_PYTHON,
+		MINIMAL_REQUIRES_PYTHON_COMPLEX
+		)
+from tests.utils import write_files
 from whey.__main__ import main  # noqa: F401
 
 if TYPE_CHECKING:
@@ -158,16 +165,19 @@ package = "whey"
 """
 
 
+@pytest.fixture(autouse=True)
+def no_compress(monkeypatch) -> None:
+	# Overrides the fixture in conftest.py, so the PEP 517 hooks are tested with the default compression.
+	monkeypatch.delenv("WHEY_NO_COMPRESS", raising=False)
+
+
 @pytest.mark.parametrize(
 		"config",
 		[
 				pytest.param(MINIMAL_CONFIG, id="minimal"),
-				pytest.param(f'{MINIMAL_CONFIG}\ndescription = "Lovely Spam! Wonderful Spam!"', id="description"),
-				pytest.param(f'{MINIMAL_CONFIG}\nrequires-python = ">=3.8"', id="requires-python"),
-				pytest.param(
-						f'{MINIMAL_CONFIG}\nrequires-python = ">=2.7,!=3.0.*,!=3.2.*"',
-						id="requires-python_complex"
-						),
+				pytest.param(MINIMAL_DESCRIPTION, id="description"),
+				pytest.param(MINIMAL_REQUIRES_PYTHON, id="requires-python"),
+				pytest.param(MINIMAL_REQUIRES_PYTHON_COMPLEX, id="requires-python_complex"),
 				pytest.param(KEYWORDS, id="keywords"),
 				pytest.param(AUTHORS, id="authors"),
 				pytest.param(MAINTAINERS, id="maintainers"),
@@ -185,8 +195,7 @@ def test_cli_build_success(
 		capsys: "CaptureFixture[str]",
 		):
 	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "spam").mkdir()
-	(tmp_pathplus / "spam" / "__init__.py").write_clean("print('hello world)")
+	write_files(tmp_pathplus, {"spam/__init__.py": "print('hello world)\n"})
 
 	data: Dict[str, Any] = {}
 
@@ -197,6 +206,7 @@ def test_cli_build_success(
 
 	with handy_archives.ZipFile(tmp_pathplus / wheel) as zip_file:
 		data["wheel_content"] = sorted(zip_file.namelist())
+		assert all(info.compress_type == zipfile.ZIP_DEFLATED for info in zip_file.infolist())
 
 		assert zip_file.read_text("spam/__init__.py") == "print('hello world)\n"
 
@@ -205,7 +215,7 @@ def test_cli_build_success(
 
 	assert (tmp_pathplus / sdist).is_file()
 
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
 		data["sdist_content"] = sorted(tar.getnames())
 		assert tar.read_text("spam-2020.0.0/spam/__init__.py") == "print('hello world)\n"
 
@@ -234,11 +244,12 @@ def test_build_complete(
 		monkeypatch
 		):
 	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"whey/__init__.py": "print('hello world)\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
 
 	data: Dict[str, Any] = {}
 
@@ -260,7 +271,7 @@ def test_build_complete(
 
 	assert (tmp_pathplus / sdist).is_file()
 
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
 		data["sdist_content"] = sorted(tar.getnames())
 
 		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world)\n"
@@ -297,11 +308,12 @@ def test_build_editable(
 		editables_version: str
 		):
 	(tmp_pathplus / "pyproject.toml").write_clean(config)
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"whey/__init__.py": "print('hello world)\n",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
 
 	data: Dict[str, Any] = {}
 
@@ -346,16 +358,16 @@ def test_build_additional_files(
 			'  "recursive-exclude whey/static *.txt",',
 			']',
 			])
-	(tmp_pathplus / "whey").mkdir()
-	(tmp_pathplus / "whey" / "__init__.py").write_clean("print('hello world)")
-	(tmp_pathplus / "whey" / "style.css").write_clean("This is the style.css file")
-	(tmp_pathplus / "whey" / "static").mkdir()
-	(tmp_pathplus / "whey" / "static" / "foo.py").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.c").touch()
-	(tmp_pathplus / "whey" / "static" / "foo.txt").touch()
-	(tmp_pathplus / "README.rst").write_clean("Spam Spam Spam Spam")
-	(tmp_pathplus / "LICENSE").write_clean("This is the license")
-	(tmp_pathplus / "requirements.txt").write_clean("domdf_python_tools")
+	write_files(tmp_pathplus, {
+			"whey/__init__.py": "print('hello world)\n",
+			"whey/style.css": "This is the style.css file\n",
+			"whey/static/foo.py": "",
+			"whey/static/foo.c": "",
+			"whey/static/foo.txt": "",
+			"README.rst": "Spam Spam Spam Spam\n",
+			"LICENSE": "This is the license\n",
+			"requirements.txt": "domdf_python_tools\n",
+			})
 
 	data: Dict[str, Any] = {}
 
@@ -377,7 +389,7 @@ def test_build_additional_files(
 
 	assert (tmp_pathplus / sdist).is_file()
 
-	with handy_archives.TarFile.open(tmp_pathplus / sdist) as tar:
+	with handy_archives.TarFile.open(tmp_pathplus / sdist, mode="r:gz") as tar:
 		data["sdist_content"] = sorted(tar.getnames())
 
 		assert tar.read_text("whey-2021.0.0/whey/__init__.py") == "print('hello world)\n"
@@ -0,0 +1,96 @@
+# stdlib
+import copy
+import functools
+import os
+import shutil
+from typing import Any, Dict, Mapping, Union
+
+# 3rd party
+import dom_toml
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+
+def write_files(root: PathPlus, files: Mapping[str, Union[str, bytes]]) -> None:
+	"""
+	Write each of ``files`` (a mapping of relative filenames to contents) below ``root``.
+
+	:class:`str` contents are encoded as UTF-8, and :class:`bytes` are written as-is.
+	The contents are written verbatim, so must already end with a newline where one is wanted.
+	Existing files are replaced rather than truncated,
+	so files hard linked by :func:`~.link_files` are left intact.
+	"""
+
+	for filename, content in files.items():
+		path = root / filename
+		path.parent.maybe_make(parents=True)
+
+		try:
+			os.unlink(path)
+		except FileNotFoundError:
+			pass
+
+		# O_BINARY prevents newline translation on Windows.
+		fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+		try:
+			os.write(fd, content.encode("UTF-8") if isinstance(content, str) else content)
+		finally:
+			os.close(fd)
+
+
+@functools.lru_cache(maxsize=None)
+def _clean(text: str) -> bytes:
+	# The same transformation as ``PathPlus.write_clean``, encoded ready for writing.
+	# Cached because the configurations are module-level constants reused between tests.
+	lines = [line.rstrip() for line in text.split('\n')]
+
+	while lines and not lines[-1]:
+		lines.pop()
+
+	return ''.join(f"{line}\n" for line in lines).encode("UTF-8")
+
+
+def write_pyproject(root: PathPlus, config: str) -> None:
+	"""
+	Write ``config`` to ``root / "pyproject.toml"``, as ``PathPlus.write_clean`` would.
+	"""
+
+	write_files(root, {"pyproject.toml": _clean(config)})
+
+
+def link_files(source: PathPlus, destination: PathPlus) -> None:
+	"""
+	Populate ``destination`` with the files below ``source``.
+
+	The files are hard linked where possible, so tests must not modify them in place.
+	"""
+
+	for filename in source.rglob('*'):
+		if not filename.is_file():
+			continue
+
+		target = destination / filename.relative_to(source)
+		target.parent.maybe_make(parents=True)
+
+		try:
+			os.link(filename, target)
+		except OSError:
+			shutil.copy2(filename, target)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_toml(text: str, **kwargs) -> Dict[str, Any]:
+	return dom_toml.loads(text, **kwargs)
+
+
+def cached_toml_load(filename: PathLike, **kwargs) -> Dict[str, Any]:
+	"""
+	Drop-in replacement for :func:`dom_toml.load` which only parses each distinct file once per session.
+
+	The tests reuse a few configurations many times over, whereas in real use
+	each PEP 517 hook runs in a fresh process and loads ``pyproject.toml`` once.
+
+	Each call returns a deep copy, so callers may modify the result freely.
+	"""
+
+	return copy.deepcopy(_parse_toml(PathPlus(filename).read_text(), **kwargs))
@@ -39,7 +39,7 @@ from abc import ABC, abstractmethod
 from email.headerregistry import Address
 from functools import partial
 from posixpath import join as posixpath_join
-from typing import TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional, Union
 from warnings import warn as warnings_warn
 
 # 3rd party
@@ -740,6 +740,20 @@ class WheelBuilder(AbstractBuilder):
 		else:
 			raise ValueError(f"'SOURCE_DATE_EPOCH' must be an integer with no fractional component, not {epoch!r}")
 
+	@staticmethod
+	def get_compression() -> int:
+		"""
+		Returns the compression method to use for the members of the wheel archive.
+
+		This is :py:data:`zipfile.ZIP_DEFLATED`, unless the :envvar:`WHEY_NO_COMPRESS` environment variable
+		is set to ``1``, in which case the members are stored uncompressed (:py:data:`zipfile.ZIP_STORED`).
+		"""
+
+		if int(os.getenv("WHEY_NO_COMPRESS", 0)):
+			return zipfile.ZIP_STORED
+		else:
+			return zipfile.ZIP_DEFLATED
+
 	def create_wheel_archive(self) -> str:
 		"""
 		Create the wheel archive.
@@ -750,6 +764,19 @@ class WheelBuilder(AbstractBuilder):
 		wheel_filename = self.out_dir / f"{self.archive_name}-{self.tag}.whl"
 		self.out_dir.maybe_make(parents=True)
 
+		self.write_wheel_archive(wheel_filename)
+
+		self._echo(Fore.GREEN(f"Wheel created at {wheel_filename.resolve().as_posix()}"))
+
+		return wheel_filename.name
+
+	def write_wheel_archive(self, archive: Union[PathLike, IO[bytes]]) -> None:
+		"""
+		Write the contents of the build directory to ``archive`` as a wheel.
+
+		:param archive: The filename of the archive, or a binary file-like object to write it to.
+		"""
+
 		mtime = self.get_source_epoch()
 
 		non_record_filenames = []
@@ -767,7 +794,7 @@ class WheelBuilder(AbstractBuilder):
 		record_filenames = sort_paths(*record_filenames, self.dist_info / "RECORD")
 
 		# Perhaps LZMA support in the future
-		with handy_archives.ZipFile(wheel_filename, mode='w', compression=zipfile.ZIP_DEFLATED) as wheel_archive:
+		with handy_archives.ZipFile(archive, mode='w', compression=self.get_compression()) as wheel_archive:
 			with (self.dist_info / "RECORD").open('w') as fp:
 				for file in sort_paths(*non_record_filenames):  # pylint: disable=loop-invariant-statement
 
@@ -790,10 +817,6 @@ class WheelBuilder(AbstractBuilder):
 						)
 				self.report_written(file)
 
-		self._echo(Fore.GREEN(f"Wheel created at {wheel_filename.resolve().as_posix()}"))
-
-		return wheel_filename.name
-
 	def create_editables_files(self) -> Iterator[ComparableRequirement]:
 		"""
 		Generate files with `editables`_ for use in a :pep:`660` wheel.
@@ -835,13 +858,7 @@ class WheelBuilder(AbstractBuilder):
 
 		yield from map(ComparableRequirement, my_project.dependencies())
 
-	def build_wheel(self) -> str:
-		"""
-		Build the binary wheel distribution.
-
-		:return: The filename of the created archive.
-		"""
-
+	def _prepare_wheel(self) -> None:
 		if self.build_dir.is_dir():
 			shutil.rmtree(self.build_dir)
 
@@ -855,10 +872,32 @@ class WheelBuilder(AbstractBuilder):
 		self.write_wheel()
 		self.call_additional_hooks()
 
+	def build_wheel(self) -> str:
+		"""
+		Build the binary wheel distribution.
+
+		:return: The filename of the created archive.
+		"""
+
+		self._prepare_wheel()
 		return self.create_wheel_archive()
 
 	build = build_wheel
 
+	def _build_wheel_to_stream(self, stream: IO[bytes]) -> str:
+		"""
+		Build the binary wheel distribution, writing the archive to ``stream`` rather than into :attr:`~.out_dir`.
+
+		:param stream: A seekable binary file-like object, such as :class:`io.BytesIO`.
+
+		:return: The filename the archive would have been given in :attr:`~.out_dir`.
+		"""
+
+		self._prepare_wheel()
+		self.write_wheel_archive(stream)
+
+		return f"{self.archive_name}-{self.tag}.whl"
+
 	def build_editable(self) -> str:
 		"""
 		Build an editable wheel.